@@ -6,12 +6,13 @@ import tempfile
 import time
 import traceback
 from collections import deque
-from contextlib import asynccontextmanager, contextmanager
+from contextlib import asynccontextmanager
 from functools import total_ordering
 from queue import Empty as NormalEmpty
 from queue import Queue as NormalQueue
 
 from delfick_project.logging import lc
+from delfick_project.norms import dictobj
 from photons_app.errors import PhotonsAppError
 from photons_messages import fields
 
@@ -47,24 +48,109 @@ class Color(fields.Color):
     def __init__(self, hue, saturation, brightness, kelvin):
         super().__init__(hue=hue, saturation=saturation, brightness=brightness, kelvin=kelvin)
 
+    def _forget_cached(self):
+        self.__dict__.pop("_compare_key", None)
+        self.__dict__.pop("_as_dict", None)
+
+    def __setitem__(self, key, val):
+        self._forget_cached()
+        super().__setitem__(key, val)
+
+    def __delitem__(self, key):
+        self._forget_cached()
+        super().__delitem__(key)
+
+    def __ior__(self, other):
+        self._forget_cached()
+        return super().__ior__(other)
+
+    def update(self, *args, **kwargs):
+        self._forget_cached()
+        super().update(*args, **kwargs)
+
+    def pop(self, *args):
+        self._forget_cached()
+        return super().pop(*args)
+
+    def popitem(self):
+        self._forget_cached()
+        return super().popitem()
+
+    def setdefault(self, *args):
+        self._forget_cached()
+        return super().setdefault(*args)
+
+    def clear(self):
+        self._forget_cached()
+        super().clear()
+
+    @property
+    def compare_key(self):
+        """
+        The rounded ``(hue, saturation, brightness, kelvin)`` we use in equality
+
+        This is remembered until one of the fields is changed.
+        """
+        key = self.__dict__.get("_compare_key")
+        if key is None:
+            key = self.__dict__["_compare_key"] = self.make_compare_key(self.as_dict())
+        return key
+
+    @classmethod
+    def make_compare_key(kls, color):
+        # for hue a step is 360/65535 so its only accurate to within 0.0055
+        # In practise, the firmware does truncate values such that 0.0055 becomes
+        # 0.011 and so we should only compare to one decimal for hue here.
+        # for brightness and saturation a step is 1/65535 so 4 digits is fine
+        return (
+            round(color["hue"], 1) % 360,
+            round(color["saturation"], 4),
+            round(color["brightness"], 4),
+            round(color["kelvin"], 4),
+        )
+
     def clone(self):
-        return Color(self.hue, self.saturation, self.brightness, self.kelvin)
+        # Copy the stored values rather than reading them out and normalising them again
+        clone = self.__class__.__new__(self.__class__)
+        fields.Color.__init__(clone)
+        for key, value in self.actual_items():
+            dictobj.__setitem__(clone, key, value)
+
+        # Neither of these are ever changed in place
+        for key in ("_as_dict", "_compare_key"):
+            if key in self.__dict__:
+                clone.__dict__[key] = self.__dict__[key]
+
+        return clone
 
     def as_dict(self):
-        """A copy of as_dict with no keyword arguments to avoid confusing MergedOptions"""
-        return {
-            "hue": self.hue,
-            "saturation": self.saturation,
-            "brightness": self.brightness,
-            "kelvin": self.kelvin,
-        }
+        """
+        A copy of as_dict with no keyword arguments to avoid confusing MergedOptions
+
+        Reading a field from a packet goes through its spec, so we remember the
+        values until one of the fields is changed.
+        """
+        cached = self.__dict__.get("_as_dict")
+        if cached is None:
+            cached = self.__dict__["_as_dict"] = {
+                "hue": self.hue,
+                "saturation": self.saturation,
+                "brightness": self.brightness,
+                "kelvin": self.kelvin,
+            }
+        return dict(cached)
 
     def __eq__(self, other):
+        if isinstance(other, Color):
+            return self.compare_key == other.compare_key
+
         if isinstance(other, tuple):
             if len(other) != 4:
                 return False
 
-            other = Color(*other)
+            other = fields.Color(
+                hue=other[0], saturation=other[1], brightness=other[2], kelvin=other[3]
+            )
 
         if not isinstance(other, (fields.Color, dict)) and not hasattr(other, "as_dict"):
             return False
@@ -78,18 +164,7 @@ class Color(fields.Color):
 
             other = fields.Color(**other)
 
-        # for hue a step is 360/65535 so its only accurate to within 0.0055
-        # In practise, the firmware does truncate values such that 0.0055 becomes
-        # 0.011 and so we should only compare to one decimal for hue here.
-        if "hue" not in other or round(self["hue"], 1) % 360 != round(other["hue"], 1) % 360:
-            return False
-
-        for k in ("saturation", "brightness", "kelvin"):
-            # for brightness and saturation a step is 1/65535 so 4 digits is fine
-            if k not in other or round(self[k], 4) != round(other[k], 4):
-                return False
-
-        return True
+        return self.compare_key == self.make_compare_key(other)
 
 
 @total_ordering
@@ -191,6 +266,8 @@ def ensure_aexit(instance):
 
 
 class AsyncCMMixin:
+    __slots__ = ()
+
     async def __aenter__(self):
         async with ensure_aexit(self):
             return await self.start()
@@ -222,24 +299,19 @@ async def stop_async_generator(gen, provide=None, name=None, exc=None):
 
 def fut_to_string(f, with_name=True):
     if not isinstance(f, asyncio.Future):
-        s = repr(f)
+        return repr(f)
+
+    if not f.done():
+        state = "pending"
+    elif f.cancelled():
+        state = "cancelled"
     else:
-        s = ""
-        if with_name:
-            s = f"<Future#{getattr(f, 'name', None)}"
-        if not f.done():
-            s = f"{s}(pending)"
-        elif f.cancelled():
-            s = f"{s}(cancelled)"
-        else:
-            exc = f.exception()
-            if exc:
-                s = f"{s}(exception:{type(exc).__name__}:{exc})"
-            else:
-                s = f"{s}(result)"
-        if with_name:
-            s = f"{s}>"
-    return s
+        exc = f.exception()
+        state = f"exception:{type(exc).__name__}:{exc}" if exc else "result"
+
+    if with_name:
+        return f"<Future#{getattr(f, 'name', None)}({state})>"
+    return f"({state})"
 
 
 class ATicker(AsyncCMMixin):
@@ -601,37 +673,22 @@ class TaskHolder(AsyncCMMixin):
     def __init__(self, final_future, *, name=None):
         self.name = name
 
-        self.ts = []
+        # A dictionary so we keep the order tasks were added
+        # and can find and remove them without searching
+        self.ts = {}
         self.final_future = ChildOfFuture(
             final_future, name=f"TaskHolder({self.name})::__init__[final_future]"
         )
 
-        self._cleaner = None
-        self._cleaner_waiter = ResettableFuture(
-            name=f"TaskHolder({self.name})::__init__[cleaner_waiter]"
-        )
-
     def add(self, coro, *, silent=False):
         return self.add_task(async_as_background(coro, silent=silent))
 
-    def _set_cleaner_waiter(self, res):
-        self._cleaner_waiter.reset()
-        self._cleaner_waiter.set_result(True)
+    def _remove_task(self, task):
+        self.ts.pop(task, None)
 
     def add_task(self, task):
-        if not self._cleaner:
-            self._cleaner = async_as_background(self.cleaner())
-
-            t = self._cleaner
-
-            def remove_cleaner(res):
-                if self._cleaner is t:
-                    self._cleaner = None
-
-            t.add_done_callback(remove_cleaner)
-
-        task.add_done_callback(self._set_cleaner_waiter)
-        self.ts.append(task)
+        task.add_done_callback(self._remove_task)
+        self.ts[task] = None
         return task
 
     async def start(self):
@@ -661,7 +718,7 @@ class TaskHolder(AsyncCMMixin):
                             name=f"TaskHolder({self.name})::finish[wait_for_another_task]",
                         )
 
-                    self.ts = [t for t in self.ts if not t.done()]
+                    self.ts = {t: None for t in self.ts if not t.done()}
         finally:
             try:
                 await self._final()
@@ -669,12 +726,6 @@ class TaskHolder(AsyncCMMixin):
                 self.final_future.cancel()
 
     async def _final(self):
-        if self._cleaner:
-            self._cleaner.cancel()
-            await wait_for_all_futures(
-                self._cleaner, name=f"TaskHolder({self.name})::finish[finally_wait_for_cleaner]"
-            )
-
         await wait_for_all_futures(
             async_as_background(self.clean()),
             name=f"TaskHolder({self.name})::finish[finally_wait_for_clean]",
@@ -682,7 +733,8 @@ class TaskHolder(AsyncCMMixin):
 
     @property
     def pending(self):
-        return sum(1 for t in self.ts if not t.done())
+        # Tasks remove themselves from self.ts when they are done
+        return len(self.ts)
 
     def __contains__(self, task):
         return task in self.ts
@@ -690,25 +742,17 @@ class TaskHolder(AsyncCMMixin):
     def __iter__(self):
         return iter(self.ts)
 
-    async def cleaner(self):
-        while True:
-            await self._cleaner_waiter
-            self._cleaner_waiter.reset()
-            await self.clean()
-
     async def clean(self):
-        destroyed = []
-        remaining = []
-        for t in self.ts:
-            if t.done():
-                destroyed.append(t)
-            else:
-                remaining.append(t)
-
+        """
+        Tasks remove themselves from the holder when they are done. This lets
+        us get rid of any that are done but haven't had their callbacks run yet.
+        """
+        destroyed = [t for t in self.ts if t.done()]
         await wait_for_all_futures(
             *destroyed, name=f"TaskHolder({self.name})::clean[wait_for_destroyed]"
         )
-        self.ts = remaining + [t for t in self.ts if t not in destroyed and t not in remaining]
+        for t in destroyed:
+            self._remove_task(t)
 
 
 class ResultStreamer(AsyncCMMixin):
@@ -997,8 +1041,7 @@ class ResultStreamer(AsyncCMMixin):
                 await self.queue.finish()
 
 
-@contextmanager
-def just_log_exceptions(log, *, reraise=None, message="Unexpected error"):
+class just_log_exceptions:
     """
     A context manager that will catch all exceptions and just call::
 
@@ -1020,12 +1063,26 @@ def just_log_exceptions(log, *, reraise=None, message="Unexpected error"):
         with just_log_exceptions(log, reraise=[asyncio.CancelledError], message=message):
             await do_something()
     """
-    try:
-        yield
-    except Exception as error:
-        if reraise and any(isinstance(error, r) for r in reraise):
-            raise
-        log.error(message, exc_info=sys.exc_info())
+
+    __slots__ = ("log", "reraise", "message")
+
+    def __init__(self, log, *, reraise=None, message="Unexpected error"):
+        self.log = log
+        self.reraise = reraise
+        self.message = message
+
+    def __enter__(self):
+        pass
+
+    def __exit__(self, exc_typ, exc, tb):
+        if exc is None or not isinstance(exc, Exception):
+            return False
+
+        if self.reraise and any(isinstance(exc, r) for r in self.reraise):
+            return False
+
+        self.log.error(self.message, exc_info=(exc_typ, exc, tb))
+        return True
 
 
 def add_error(catcher, error):
@@ -1035,16 +1092,15 @@ def add_error(catcher, error):
     This means if it's callable we call it with the error and if it's a ``list``
     or ``set`` we add the error to it.
     """
-    if callable(catcher):
-        catcher(error)
-    elif type(catcher) is list:
+    if type(catcher) is list:
         catcher.append(error)
+    elif callable(catcher):
+        catcher(error)
     elif type(catcher) is set:
         catcher.add(error)
 
 
-@contextmanager
-def a_temp_file():
+class a_temp_file:
     """
     Yield the name of a temporary file and ensure it's removed after use
 
@@ -1055,17 +1111,17 @@ def a_temp_file():
             fle.flush()
             os.system("cat {0}".format(fle.name))
     """
-    filename = None
-    tmpfile = None
-    try:
-        tmpfile = tempfile.NamedTemporaryFile(delete=False)
-        filename = tmpfile.name
-        yield tmpfile
-    finally:
-        if tmpfile is not None:
-            tmpfile.close()
-        if filename and os.path.exists(filename):
-            os.remove(filename)
+
+    __slots__ = ("tmpfile",)
+
+    def __enter__(self):
+        self.tmpfile = tempfile.NamedTemporaryFile(delete=False)
+        return self.tmpfile
+
+    def __exit__(self, exc_typ, exc, tb):
+        self.tmpfile.close()
+        if os.path.exists(self.tmpfile.name):
+            os.remove(self.tmpfile.name)
 
 
 def nested_dict_retrieve(data, keys, dflt):
@@ -1084,26 +1140,15 @@ def nested_dict_retrieve(data, keys, dflt):
 
         nested_dict_retrieve(data, ["one", "four"], 6) == 6
     """
-    if not keys:
-        return data
-
-    for key in keys[:-1]:
+    for key in keys:
         if type(data) is not dict:
             return dflt
 
-        if key not in data:
+        data = data.get(key, Nope)
+        if data is Nope:
             return dflt
 
-        data = data[key]
-
-    if type(data) is not dict:
-        return dflt
-
-    last_key = keys[-1]
-    if last_key not in data:
-        return dflt
-
-    return data[last_key]
+    return data
 
 
 def fut_has_callback(fut, callback):
@@ -1342,9 +1387,11 @@ class memoized_property:
         if instance is None:
             return self
 
-        if getattr(instance, self.cache_name, self.Empty) is self.Empty:
-            setattr(instance, self.cache_name, self.func(instance))
-        return getattr(instance, self.cache_name)
+        value = getattr(instance, self.cache_name, self.Empty)
+        if value is self.Empty:
+            value = self.func(instance)
+            setattr(instance, self.cache_name, value)
+        return value
 
     def __set__(self, instance, value):
         setattr(instance, self.cache_name, value)
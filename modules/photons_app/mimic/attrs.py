@@ -1,4 +1,5 @@
 import fnmatch
+import sys
 
 from delfick_project.norms import sb
 from photons_app.mimic.event import Events
@@ -49,6 +50,9 @@ class Path:
     async def set(self, at, part, value, event):
         if isinstance(at, Attrs):
             at = at._attrs
+            if isinstance(part, str):
+                # Attributes are mostly read as attrs.name, which uses interned strings
+                part = sys.intern(part)
 
         if isinstance(part, str) and hasattr(at, part):
             if hasattr(at, "attr_change"):
@@ -258,6 +262,8 @@ class ChangeAttr:
 
 
 class Attrs:
+    __slots__ = ("_device", "_attrs", "_started")
+
     def __init__(self, device):
         self._device = device
         self._attrs = {}
@@ -305,10 +311,10 @@ class Attrs:
         if key.startswith("_") or key.startswith("attrs_") or key == "as_dict":
             return object.__getattribute__(self, key)
         else:
-            attrs = object.__getattribute__(self, "_attrs")
-            if key not in attrs:
-                raise AttributeError(f"No such attribute {key}")
-            return attrs[key]
+            try:
+                return self._attrs[key]
+            except KeyError:
+                raise AttributeError(f"No such attribute {key}") from None
 
     def __dir__(self):
         return sorted(object.__dir__(self) + list(self._attrs.keys()))
@@ -1,6 +1,5 @@
 import asyncio
 import logging
-import socket
 
 from delfick_project.norms import dictobj, sb
 from photons_app import helpers as hp
@@ -10,13 +9,6 @@ from photons_app.mimic.transport import MemoryService
 from photons_messages import DiscoveryMessages, Services
 
 
-def make_port():
-    """Return the port to listen to"""
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-        s.bind(("0.0.0.0", 0))
-        return s.getsockname()[1]
-
-
 @operator
 class MemoryIO(IO):
     io_source = MemoryService.name
@@ -81,15 +73,14 @@ class UDPIO(MemoryIO):
             def connection_made(sp, transport):
                 sp.udp_transport = transport
 
+            async def give_reply(sp, bts, addr, replying_to, *, reply):
+                if sp.udp_transport and not sp.udp_transport.is_closing():
+                    sp.udp_transport.sendto(bts, addr)
+
             def datagram_received(sp, data, addr):
                 if not self.device.has_power:
                     return
-
-                async def give_reply(bts, addr, replying_to, *, reply):
-                    if sp.udp_transport and not sp.udp_transport.is_closing():
-                        sp.udp_transport.sendto(bts, addr)
-
-                self.received(data, give_reply, addr)
+                self.received(data, sp.give_reply, addr)
 
         port = None
         error = None
@@ -97,17 +88,17 @@ class UDPIO(MemoryIO):
         async with hp.tick(0.1, max_iterations=3) as ticker:
             async for _ in ticker:
                 port = self.options.port
-                if port is None:
-                    port = make_port()
 
+                # Binding to port 0 lets the OS choose a free port for us
                 try:
                     remote, _ = await hp.get_event_loop().create_datagram_endpoint(
-                        ServerProtocol, local_addr=("0.0.0.0", port)
+                        ServerProtocol, local_addr=("0.0.0.0", 0 if port is None else port)
                     )
                     self.remote = remote
                 except OSError as e:
                     error = e
                 else:
+                    port = remote.get_extra_info("sockname")[1]
                     await self.device.annotate(
                         logging.INFO,
                         f"Creating {self.io_source} port",
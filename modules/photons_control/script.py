@@ -1,6 +1,7 @@
 import asyncio
 import logging
 import sys
+import time
 
 from delfick_project.norms import sb
 from photons_app import helpers as hp
@@ -28,13 +29,15 @@ async def find_serials(reference, sender, timeout):
 
     Otherwise we assume it's a special reference
     """
-    if not isinstance(reference, SpecialReference):
-        if reference in ("", "_", None, sb.NotSpecified):
+    if isinstance(reference, str):
+        if reference in ("", "_"):
             reference = FoundSerials()
         else:
-            if isinstance(reference, str):
-                reference = reference.split(",")
-            reference = HardCodedSerials(reference)
+            reference = HardCodedSerials(reference.split(","))
+    elif reference is None or reference is sb.NotSpecified:
+        reference = FoundSerials()
+    elif not isinstance(reference, SpecialReference):
+        reference = HardCodedSerials(reference)
 
     found, serials = await reference.find(sender, timeout=timeout)
     missing = reference.missing(found)
@@ -94,11 +97,16 @@ def Pipeline(*messages, spread=0, short_circuit_on_error=False, synchronized=Fal
     """
 
     async def gen(reference, sender, **kwargs):
-        min_wait = False
         if spread <= 0:
-            min_wait = 0
+            # No need to go through the event loop for a ticker that never waits
+            for msg in messages:
+                t = yield msg
+                success = await t
+                if not success and short_circuit_on_error:
+                    return
+            return
 
-        async with hp.tick(spread, min_wait=min_wait) as ticks:
+        async with hp.tick(spread, min_wait=False) as ticks:
             async for i, _ in ticks:
                 if i > len(messages):
                     return
@@ -120,7 +128,7 @@ def Pipeline(*messages, spread=0, short_circuit_on_error=False, synchronized=Fal
     return m
 
 
-def Repeater(msg, min_loop_time=30, on_done_loop=None):
+def Repeater(msg, min_loop_time=30, on_done_loop=None, discovery_interval=None):
     """
     This will send the provided msg in an infinite loop
 
@@ -155,7 +163,7 @@ def Repeater(msg, min_loop_time=30, on_done_loop=None):
 
     Note that if references is a
     :ref:`SpecialReference <special_reference_objects>` then we call reset on
-    it after every loop.
+    it after every loop, unless ``discovery_interval`` says otherwise.
 
     Also it is highly recommended that error_catcher is a callable that takes
     each error as they happen.
@@ -174,16 +182,42 @@ def Repeater(msg, min_loop_time=30, on_done_loop=None):
 
         Note that if you raise ``Repeater.Stop()`` in this function then the
         Repeater will stop.
+
+    discovery_interval
+        The minimum amount of time in seconds between resetting a
+        :ref:`SpecialReference <special_reference_objects>`.
+
+        By default the reference is reset after every loop, which means the
+        devices are discovered again for each loop. Setting this means the
+        serials found by the reference are reused by loops until this much time
+        has passed since they were discovered. A discovery that fails is not
+        reused, so the next loop always discovers again.
     """
 
     async def gen(reference, sender, **kwargs):
+        discovered_at = None
+        special = isinstance(reference, SpecialReference)
+
         async with hp.tick(min_loop_time, min_wait=False, final_future=sender.stop_fut) as ticks:
             async for i, _ in ticks:
+                if special and (discovered_at is None or not reference.finding.done()):
+                    # This loop does the discovery, so the interval starts now
+                    discovered_at = time.time()
+
                 try:
                     await (yield msg)
                 finally:
-                    if isinstance(reference, SpecialReference):
-                        reference.reset()
+                    if special:
+                        found = reference.found
+                        failed = found.done() and (
+                            found.cancelled() or found.exception() is not None
+                        )
+                        if (
+                            discovery_interval is None
+                            or failed
+                            or time.time() - discovered_at >= discovery_interval
+                        ):
+                            reference.reset()
 
                     if callable(on_done_loop):
                         try:
@@ -199,6 +233,7 @@ def Repeater(msg, min_loop_time=30, on_done_loop=None):
     m.repeater_msg = msg
     m.repeater_on_done_loop = on_done_loop
     m.repeater_min_loop_time = min_loop_time
+    m.repeater_discovery_interval = discovery_interval
     return m
 
 
@@ -272,6 +307,10 @@ def FromGeneratorPerSerial(inner_gen, **generator_kwargs):
         for serial in missing:
             yield FailedToFindDevice(serial=serial)
 
+        if len(serials) == 1:
+            yield FromGenerator(inner_gen, reference_override=serials[0], **generator_kwargs)
+            return
+
         yield [
             FromGenerator(inner_gen, reference_override=serial, **generator_kwargs)
             for serial in serials
@@ -373,6 +412,14 @@ class FromGenerator:
         )
 
     class Item:
+        __slots__ = (
+            "generator",
+            "runner_kls",
+            "simplifier",
+            "reference_override",
+            "error_catcher_override",
+        )
+
         def __init__(self, simplifier, generator, runner_kls, reference_override, catcher_override):
             self.generator = generator
             self.runner_kls = runner_kls
@@ -399,11 +446,22 @@ class FromGenerator:
                         yield result
             finally:
                 if do_raise and error_catcher:
-                    raise RunErrors(_errors=list(set(error_catcher)))
+                    if len(error_catcher) > 1:
+                        error_catcher = list(dict.fromkeys(error_catcher))
+                    raise RunErrors(_errors=error_catcher)
 
     class Runner(hp.AsyncCMMixin):
-        class Done:
-            pass
+        __slots__ = (
+            "item",
+            "kwargs",
+            "reference",
+            "sender",
+            "retrieve_kwargs",
+            "run_reference",
+            "generator_reference",
+            "stop_fut",
+            "streamer",
+        )
 
         class Value:
             pass
@@ -411,12 +469,39 @@ class FromGenerator:
         class Unsuccessful(Exception):
             pass
 
+        class ErrorTracker:
+            """An error_catcher that remembers if it was given any errors"""
+
+            __slots__ = ("error_catcher", "success")
+
+            def __init__(self, error_catcher):
+                self.success = True
+                self.error_catcher = error_catcher
+
+            def __call__(self, error):
+                self.success = False
+                hp.add_error(self.error_catcher, error)
+
         def __init__(self, item, stop_fut, reference, sender, kwargs):
             self.item = item
             self.kwargs = kwargs
             self.reference = reference
             self.sender = sender
 
+            # retrieve provides it's own error_catcher to each item
+            self.retrieve_kwargs = {k: v for k, v in kwargs.items() if k != "error_catcher"}
+
+            reference_override = item.reference_override
+            if reference_override is None:
+                self.run_reference = None
+                self.generator_reference = reference
+            elif reference_override is True:
+                self.run_reference = reference
+                self.generator_reference = reference
+            else:
+                self.run_reference = reference_override
+                self.generator_reference = reference_override
+
             self.stop_fut = hp.ChildOfFuture(
                 stop_fut, name="FromGenerator>Runner::__init__[stop_fut]"
             )
@@ -442,21 +527,11 @@ class FromGenerator:
         def error_catcher(self):
             return self.kwargs.get("error_catcher")
 
-        @property
-        def generator_reference(self):
-            if self.item.reference_override in (None, True):
-                return self.reference
-            return self.item.reference_override
-
-        @property
-        def run_reference(self):
-            if self.item.reference_override is True:
-                return self.reference
-            elif self.item.reference_override is not None:
-                return self.item.reference_override
-
         async def getter(self):
             gen = self.item.generator(self.generator_reference, self.sender, **self.kwargs)
+
+            # consume must run alongside us so we can yield results while the generator
+            # is still going. Some generators, like the Repeater, never finish.
             await self.streamer.add_coroutine(self.consume(gen, self.streamer), context="consume")
             self.streamer.no_more_work()
 
@@ -468,6 +543,7 @@ class FromGenerator:
 
         async def consume(self, gen, streamer):
             complete = None
+            exhausted = False
 
             try:
                 while True:
@@ -485,21 +561,24 @@ class FromGenerator:
                             self.retrieve_all(msg, complete), context=self.Value
                         )
                     except StopAsyncIteration:
+                        exhausted = True
                         break
             finally:
                 exc_info = sys.exc_info()
                 if exc_info[0] not in (None, asyncio.CancelledError):
                     hp.add_error(self.error_catcher, exc_info[1])
 
-                await streamer.add_coroutine(
-                    hp.stop_async_generator(
-                        gen,
-                        complete,
-                        name="FromGenerator>Runner::consume[finally_stop_gen]",
-                        exc=exc_info[1],
-                    ),
-                    force=True,
-                )
+                # A generator that finished by itself has nothing left to stop
+                if not exhausted:
+                    await streamer.add_coroutine(
+                        hp.stop_async_generator(
+                            gen,
+                            complete,
+                            name="FromGenerator>Runner::consume[finally_stop_gen]",
+                            exc=exc_info[1],
+                        ),
+                        force=True,
+                    )
 
                 if exc_info[0] is not asyncio.CancelledError:
                     return False
@@ -535,17 +614,12 @@ class FromGenerator:
                         complete.set_result(False)
 
         async def retrieve(self, item):
-            i = {"success": True}
-
-            def error(e):
-                i["success"] = False
-                hp.add_error(self.error_catcher, e)
-
-            kwargs = dict(self.kwargs)
-            kwargs["error_catcher"] = error
+            error = self.ErrorTracker(self.error_catcher)
 
-            async for info in item.run(self.run_reference, self.sender, **kwargs):
+            async for info in item.run(
+                self.run_reference, self.sender, error_catcher=error, **self.retrieve_kwargs
+            ):
                 yield info
 
-            if not i["success"]:
+            if not error.success:
                 raise self.Unsuccessful()
@@ -11,6 +11,7 @@ for defining ``by_type`` on the class.
 import binascii
 import inspect
 import logging
+import struct
 from textwrap import dedent
 
 from bitarray import bitarray
@@ -22,6 +23,9 @@ log = logging.getLogger("photons_protocol.messages")
 T = Type
 MultiOptions = MultiOptions
 
+# protocol is the first 12 bits of bytes 2-4 and pkt_type is bytes 32-34
+uint16 = struct.Struct("<H")
+
 
 class PacketTypeExtractor:
     @classmethod
@@ -81,10 +85,7 @@ class PacketTypeExtractor:
         if len(data) < 4:
             raise BadConversion("Data is too small to be a LIFX packet", got=len(data))
 
-        b = bitarray(endian="little")
-        b.frombytes(data[2:4])
-        protbts = b[:12].tobytes()
-        protocol = protbts[0] + (protbts[1] << 8)
+        protocol = uint16.unpack_from(data, 2)[0] & 0xFFF
 
         pkt_type = None
 
@@ -93,7 +94,7 @@ class PacketTypeExtractor:
                 raise BadConversion(
                     "Data is too small to be a LIFX packet", need_atleast=36, got=len(data)
                 )
-            pkt_type = data[32] + (data[33] << 8)
+            pkt_type = uint16.unpack_from(data, 32)[0]
 
         return protocol, pkt_type
 
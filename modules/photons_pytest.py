@@ -500,20 +500,19 @@ def pytest_configure(config):
     pytest.helpers.register(FutureDominoes)
     pytest.helpers.register(__import__("photons_app.mimic").mimic.DeviceCollection, name="mimic")
 
+    capability_names = []
+
     @pytest.helpers.register
     def has_caps_list(*have):
-        from photons_products.lifx import Capability
-
-        result = []
-        for capability in list(Capability.Meta.capabilities) + Capability.Meta.properties:
-            if capability.startswith("has_"):
-                a = capability[4:]
-                if a in have:
-                    result.append(a)
-                else:
-                    result.append(f"not_{a}")
+        if not capability_names:
+            from photons_products.lifx import Capability
+
+            for capability in list(Capability.Meta.capabilities) + Capability.Meta.properties:
+                if capability.startswith("has_"):
+                    capability_names.append(capability[4:])
 
-        return sorted(result)
+        have = set(have)
+        return sorted(a if a in have else f"not_{a}" for a in capability_names)
 
     @pytest.helpers.register
     def assertRegex(regex, value):
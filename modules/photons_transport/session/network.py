@@ -75,6 +75,10 @@ class NetworkSession(Communication):
         kwargs["accept_found"] = True
         kwargs["error_catcher"] = []
 
+        wanted = None
+        if serials is not None:
+            wanted = {binascii.unhexlify(serial)[:6] for serial in serials}
+
         async for time_left, time_till_next in self._search_retry_iterator(timeout):
             kwargs["message_timeout"] = time_till_next
 
@@ -85,10 +89,10 @@ class NetworkSession(Communication):
                         found_now.add(pkt.target[:6])
                         await self.add_service(pkt.serial, pkt.service, host=addr[0], port=pkt.port)
 
-            if serials is None:
+            if wanted is None:
                 if found_now:
                     break
-            elif all(binascii.unhexlify(serial)[:6] in found_now for serial in serials):
+            elif wanted <= found_now:
                 break
 
         return list(found_now)
@@ -4,13 +4,30 @@ from delfick_project.norms import Meta, dictobj, sb
 from photons_app import helpers as hp
 from photons_app.formatter import MergedOptionStringFormatter
 from photons_control.script import FromGenerator
+from photons_protocol.packets import PacketSpecMixin
 from photons_transport.targets.item import Item
 from photons_transport.targets.script import ScriptRunner
 
 log = logging.getLogger("photons_transport.targets.base")
 
+# Whether a packet has run or simplified only depends on its class
+_packet_capabilities = {}
+
+
+def capabilities(part):
+    """Return ``(has_run, has_simplified)`` for this part of a script"""
+    kls = type(part)
+    caps = _packet_capabilities.get(kls)
+    if caps is None:
+        caps = (hasattr(part, "run"), hasattr(part, "simplified"))
+        if isinstance(part, PacketSpecMixin):
+            _packet_capabilities[kls] = caps
+    return caps
+
 
 class Sender:
+    __slots__ = ("msg", "kwargs", "target", "reference", "script")
+
     def __init__(self, target, msg, reference, **kwargs):
         self.msg = msg
         self.kwargs = kwargs
@@ -57,19 +74,21 @@ class Target(dictobj.Spec):
 
     def script(self, raw):
         """Return us a ScriptRunner for the given `raw` against this `target`"""
-        items = list(self.simplify(raw))
-        if not items:
-            items = None
-        elif len(items) > 1:
-            original = items
+        simplified = self.simplify(raw)
+        first = next(simplified, None)
+        second = next(simplified, None)
+
+        if second is None:
+            items = first
+        else:
+            # The script may be run many times, so the rest must be kept around
+            original = [first, second, *simplified]
 
             async def gen(*args, **kwargs):
                 for item in original:
                     yield item
 
-            items = list(self.simplify(FromGenerator(gen, reference_override=True)))[0]
-        else:
-            items = items[0]
+            items = next(self.simplify(FromGenerator(gen, reference_override=True)))
         return self.script_runner_kls(items, target=self)
 
     @hp.asynccontextmanager
@@ -119,19 +138,14 @@ class Target(dictobj.Spec):
         if type(script_part) is not list:
             script_part = [script_part]
 
-        final = []
+        buf = []
         for p in script_part:
-            if hasattr(p, "run"):
-                final.append(p)
-            elif hasattr(p, "simplified"):
-                final.append(p.simplified(self.simplify))
-                continue
-            else:
-                final.append(p)
+            has_run, has_simplified = capabilities(p)
+            if not has_run and has_simplified:
+                p = p.simplified(self.simplify)
+                has_run = hasattr(p, "run")
 
-        buf = []
-        for p in final:
-            if not hasattr(p, "run"):
+            if not has_run:
                 buf.append(p)
             else:
                 if buf:
@@ -4,6 +4,7 @@ import os
 from unittest import mock
 
 from delfick_project.errors_pytest import assertRaises
+from delfick_project.norms import sb
 from photons_app import helpers as hp
 from photons_messages import fields
 
@@ -52,19 +53,19 @@ describe "future to string":
 
 describe "add_error":
     it "calls the error_catcher with the error if it's a callable":
-        error = mock.Mock(name="error")
+        error = object()
         catcher = mock.Mock(name="catcher")
         hp.add_error(catcher, error)
         catcher.assert_called_once_with(error)
 
     it "appends to the error catcher if it's a list":
-        error = mock.Mock(name="error")
+        error = object()
         catcher = []
         hp.add_error(catcher, error)
         assert catcher == [error]
 
     it "adds to the error catcher if it's a set":
-        error = mock.Mock(name="error")
+        error = object()
         catcher = set()
         hp.add_error(catcher, error)
         assert catcher == set([error])
@@ -128,7 +129,7 @@ describe "just_log_exceptions":
 describe "nested_dict_retrieve":
     it "returns us the dflt if we can't find the key":
         data = {"one": {"two": {"three": 3}}}
-        dflt = mock.Mock(name="dflt")
+        dflt = object()
         for keys in (
             ["one", "four"],
             ["four", "five"],
@@ -139,7 +140,7 @@ describe "nested_dict_retrieve":
 
     it "returns us what it finds":
         data = {"one": {"two": {"three": 3}}}
-        dflt = mock.Mock(name="dflt")
+        dflt = object()
 
         assert hp.nested_dict_retrieve(data, [], dflt) == data
         assert hp.nested_dict_retrieve(data, ["one"], dflt) == {"two": {"three": 3}}
@@ -149,7 +150,7 @@ describe "nested_dict_retrieve":
 describe "memoized_property":
     it "caches on the instance":
         called = []
-        blah = mock.Mock(name="blah")
+        blah = object()
 
         class Thing:
             @hp.memoized_property
@@ -204,8 +205,8 @@ describe "memoized_property":
 
     it "can set the value":
         called = []
-        blah = mock.Mock(name="blah")
-        meh = mock.Mock(name="meh")
+        blah = object()
+        meh = object()
 
         class Thing:
             @hp.memoized_property
@@ -227,7 +228,7 @@ describe "memoized_property":
 
     it "can delete the cache":
         called = []
-        blah = mock.Mock(name="blah")
+        blah = object()
 
         class Thing:
             @hp.memoized_property
@@ -253,9 +254,11 @@ describe "memoized_property":
 describe "Color":
     it "can be made and cloned":
         c1 = hp.Color(2, 0, 0.3, 3500)
+        assert c1 == (2, 0, 0.3, 3500)
         c2 = c1.clone()
 
         assert c1 is not c2
+        assert isinstance(c2, hp.Color)
 
         for c in (c1, c2):
             assert c.hue == 2
@@ -370,3 +373,49 @@ describe "Color":
             1.0,
             3500,
         )
+
+    it "compares with new values after being changed":
+        c = hp.Color(2, 0, 0, 3500)
+        assert c == (2, 0, 0, 3500)
+
+        c.hue = 20
+        assert c == (20, 0, 0, 3500)
+        assert c != hp.Color(2, 0, 0, 3500)
+
+        c["kelvin"] = 3700
+        assert c == hp.Color(20, 0, 0, 3700)
+
+    it "compares with new values after being changed like a dictionary":
+        c = hp.Color(2, 0, 0, 3500)
+        assert c == (2, 0, 0, 3500)
+
+        c.update({"kelvin": 3700})
+        assert c == (2, 0, 0, 3700)
+
+        c |= {"kelvin": 3800}
+        assert c == (2, 0, 0, 3800)
+
+        c.pop("hue")
+        assert c.as_dict()["hue"] is sb.NotSpecified
+
+        # Values given straight to the dictionary are the raw uint16 values
+        c.setdefault("hue", 100)
+        assert c == (0.55, 0, 0, 3800)
+
+        del c["hue"]
+        assert c.as_dict()["hue"] is sb.NotSpecified
+
+        c.clear()
+        assert c.as_dict()["saturation"] is sb.NotSpecified
+
+    it "gives a new dictionary with the current values":
+        c = hp.Color(2, 0, 0, 3500)
+        d = c.as_dict()
+        assert d == {"hue": 2, "saturation": 0, "brightness": 0, "kelvin": 3500}
+
+        d["hue"] = 300
+        assert c.as_dict() == {"hue": 2, "saturation": 0, "brightness": 0, "kelvin": 3500}
+
+        c.hue = 45
+        assert c.as_dict() == {"hue": 45, "saturation": 0, "brightness": 0, "kelvin": 3500}
+        assert d == {"hue": 300, "saturation": 0, "brightness": 0, "kelvin": 3500}
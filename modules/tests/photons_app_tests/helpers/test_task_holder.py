@@ -19,7 +19,7 @@ def final_future():
 describe "TaskHolder":
     it "takes in a final future", final_future:
         holder = hp.TaskHolder(final_future)
-        assert holder.ts == []
+        assert holder.ts == {}
         assert holder.final_future == pytest.helpers.child_future_of(final_future)
 
     async it "can take in tasks", final_future:
@@ -237,11 +237,7 @@ describe "TaskHolder":
                 called = []
                 made = {}
 
-                class TaskHolderManualClean(hp.TaskHolder):
-                    async def cleaner(self):
-                        await hp.create_future()
-
-                async with TaskHolderManualClean(final_future) as ts:
+                async with hp.TaskHolder(final_future) as ts:
 
                     async def one():
                         called.append("ONE")
@@ -275,34 +271,21 @@ describe "TaskHolder":
                     await asyncio.sleep(0)
                     assert called == ["TWO"]
 
-                    assert ts.ts == [t1]
+                    assert list(ts.ts) == [t1]
                     await ts.clean()
-                    assert ts.ts == [t1]
+                    assert list(ts.ts) == [t1]
 
                     t1.cancel()
-                    await asyncio.sleep(0)
 
-                    assert called == ["TWO", "CANC_TWO", "FIN_TWO"]
-                    assert ts.ts == [t1]
-
-                    # The task holder only knows about t1
-                    # And after the clean, we expect it to have made the t2
-                    assert "t2" not in made
-                    await ts.clean()
-                    assert called == ["TWO", "CANC_TWO", "FIN_TWO", "ADD_ONE", "ONE"]
-                    assert ts.ts == [made["t2"]]
-
-                    made["t2"].cancel()
-                    await asyncio.sleep(0)
-                    assert ts.ts == [made["t2"]]
-                    await ts.clean()
-                    assert ts.ts == []
-                    assert called == [
-                        "TWO",
-                        "CANC_TWO",
-                        "FIN_TWO",
-                        "ADD_ONE",
-                        "ONE",
-                        "CANC_ONE",
-                        "FIN_ONE",
-                    ]
+                    # Done callbacks are called in the order they were added, so by the time
+                    # this wait finishes the holder has forgotten t1 and add_one has given it t2
+                    await hp.wait_for_all_futures(t1)
+                    assert called[:4] == ["TWO", "CANC_TWO", "FIN_TWO", "ADD_ONE"]
+                    assert t1 not in ts
+                    assert list(ts.ts) == [made["t2"]]
+
+                # And leaving the holder waited for t2 to finish by itself
+                assert called == ["TWO", "CANC_TWO", "FIN_TWO", "ADD_ONE", "ONE", "FIN_ONE"]
+                assert made["t2"].done()
+                assert not made["t2"].cancelled()
+                assert list(ts.ts) == []
@@ -2,7 +2,6 @@
 
 import io
 from textwrap import dedent
-from unittest import mock
 
 import pytest
 from delfick_project.errors_pytest import assertRaises
@@ -140,7 +139,7 @@ describe "Path":
                     called.append(("attr_change", part, value, event))
                     setattr(self, part, value)
 
-            event = mock.Mock(name="event")
+            event = object()
 
             path = Path(attrs, ["holder"])
             holder = Holder()
@@ -261,7 +260,7 @@ describe "Path":
                     called.append(("attr_change", part, value, event))
                     setattr(self, part, value)
 
-            event = mock.Mock(name="event")
+            event = object()
 
             path = Path(attrs, ["holder"])
             holder = Holder()
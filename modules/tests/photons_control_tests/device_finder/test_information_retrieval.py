@@ -1,6 +1,7 @@
 # coding: spec
 
 import asyncio
+from types import SimpleNamespace
 from unittest import mock
 
 import pytest
@@ -36,6 +37,23 @@ devices.add("switch")(
     ),
 )
 
+# The messages the information loop sends to each device, in InfoPoints order
+LIGHT_INFO_MSGS = (
+    DeviceMessages.GetVersion(),
+    LightMessages.GetColor(),
+    DeviceMessages.GetHostFirmware(),
+    DeviceMessages.GetGroup(),
+    DeviceMessages.GetLocation(),
+)
+
+SWITCH_INFO_MSGS = (
+    DeviceMessages.GetVersion(),
+    DeviceMessages.GetLabel(),
+    DeviceMessages.GetHostFirmware(),
+    DeviceMessages.GetGroup(),
+    DeviceMessages.GetLocation(),
+)
+
 
 class VBase:
     def __init__(self, fake_time, sender, finder, final_future):
@@ -53,25 +71,27 @@ class VBase:
             await devices["light"].power_off()
             await devices["switch"].power_on()
             self.fake_device = devices["switch"]
+        self.store = devices.store(self.fake_device)
+        self.memory_io = self.fake_device.io["MEMORY"]
+        self.any_incoming = Events.INCOMING(self.fake_device, self.memory_io, pkt=mock.ANY)
         self.device = Device.FieldSpec().empty_normalise(serial=self.fake_device.serial)
 
     async def matches(self, fltr):
         return await self.device.matches(self.sender, fltr, self.finder.collections)
 
     def received(self, *pkts, keep_duplicates=False):
-        store = devices.store(self.fake_device)
+        store = self.store
+        fake_device = self.fake_device
+        memory_io = self.memory_io
+
         total = 0
         for pkt in pkts:
-            nxt = store.count(
-                Events.INCOMING(self.fake_device, self.fake_device.io["MEMORY"], pkt=pkt)
-            )
+            nxt = store.count(Events.INCOMING(fake_device, memory_io, pkt=pkt))
             assert nxt > 0, (pkt.__class__.__name__, repr(pkt), nxt)
             total += nxt
 
         if keep_duplicates or len(pkts) == 0:
-            exists = store.count(
-                Events.INCOMING(self.fake_device, self.fake_device.io["MEMORY"], pkt=mock.ANY)
-            )
+            exists = store.count(self.any_incoming)
             assert exists == len(pkts)
         store.clear()
 
@@ -83,6 +103,37 @@ class VBase:
                 assert not f.done()
 
 
+class Waiter:
+    """Always has a future for the next time the fake device receives this kind of message"""
+
+    def __init__(self, fake_device, kls):
+        self.kls = kls
+        self.fake_device = fake_device
+        self.make_fut()
+
+    def make_fut(self, res=None):
+        self.fut = self.fake_device.attrs.event_waiter.wait_for_incoming(
+            self.fake_device.io["MEMORY"], self.kls
+        )
+        self.fut.add_done_callback(self.make_fut)
+
+    def __await__(self):
+        yield from self.fut
+
+    def add_done_callback(self, cb):
+        self.fut.add_done_callback(cb)
+
+    def remove_done_callback(self, cb):
+        self.fut.remove_done_callback(cb)
+
+    def done(self):
+        return self.fut.done()
+
+
+def make_futs(fake_device, pairs):
+    return SimpleNamespace(**{name: Waiter(fake_device, kls) for name, kls in pairs})
+
+
 describe "Device":
 
     @pytest.fixture()
@@ -183,52 +234,19 @@ describe "Device":
         await V.choose_device("light")
         fake_time.set(1)
 
-        msgs = [e.value.msg for e in list(InfoPoints) if e is not InfoPoints.LABEL]
-        assert msgs == [
-            DeviceMessages.GetVersion(),
-            LightMessages.GetColor(),
-            DeviceMessages.GetHostFirmware(),
-            DeviceMessages.GetGroup(),
-            DeviceMessages.GetLocation(),
-        ]
-
-        message_futs = {}
-
-        class Futs:
-            pass
-
-        class Waiter:
-            def __init__(s, name, kls):
-                s.name = name
-                s.kls = kls
-                s.make_fut()
-
-            def make_fut(s, res=None):
-                fut = message_futs[s.name] = V.fake_device.attrs.event_waiter.wait_for_incoming(
-                    V.fake_device.io["MEMORY"], s.kls
-                )
-                fut.add_done_callback(s.make_fut)
-
-            def __await__(s):
-                yield from message_futs[s.name]
-
-            def add_done_callback(s, cb):
-                message_futs[s.name].add_done_callback(cb)
-
-            def remove_done_callback(s, cb):
-                message_futs[s.name].remove_done_callback(cb)
-
-            def done(s):
-                return message_futs[s.name].done()
-
-        for name, kls in [
-            ("version", DeviceMessages.GetVersion),
-            ("color", LightMessages.GetColor),
-            ("firmware", DeviceMessages.GetHostFirmware),
-            ("group", DeviceMessages.GetGroup),
-            ("location", DeviceMessages.GetLocation),
-        ]:
-            setattr(Futs, name, Waiter(name, kls))
+        msgs = LIGHT_INFO_MSGS
+        assert tuple(e.value.msg for e in InfoPoints if e is not InfoPoints.LABEL) == msgs
+
+        Futs = make_futs(
+            V.fake_device,
+            [
+                ("version", DeviceMessages.GetVersion),
+                ("color", LightMessages.GetColor),
+                ("firmware", DeviceMessages.GetHostFirmware),
+                ("group", DeviceMessages.GetGroup),
+                ("location", DeviceMessages.GetLocation),
+            ],
+        )
 
         async def checker(ff):
             info = {"serial": V.fake_device.serial, "product_type": "unknown"}
@@ -326,52 +344,19 @@ describe "Device":
         await V.choose_device("switch")
         fake_time.set(1)
 
-        msgs = [e.value.msg for e in list(InfoPoints) if e is not InfoPoints.LIGHT_STATE]
-        assert msgs == [
-            DeviceMessages.GetVersion(),
-            DeviceMessages.GetLabel(),
-            DeviceMessages.GetHostFirmware(),
-            DeviceMessages.GetGroup(),
-            DeviceMessages.GetLocation(),
-        ]
-
-        message_futs = {}
-
-        class Futs:
-            pass
-
-        class Waiter:
-            def __init__(s, name, kls):
-                s.name = name
-                s.kls = kls
-                s.make_fut()
-
-            def make_fut(s, res=None):
-                fut = message_futs[s.name] = V.fake_device.attrs.event_waiter.wait_for_incoming(
-                    V.fake_device.io["MEMORY"], s.kls
-                )
-                fut.add_done_callback(s.make_fut)
-
-            def __await__(s):
-                yield from message_futs[s.name]
-
-            def add_done_callback(s, cb):
-                message_futs[s.name].add_done_callback(cb)
-
-            def remove_done_callback(s, cb):
-                message_futs[s.name].remove_done_callback(cb)
-
-            def done(s):
-                return message_futs[s.name].done()
-
-        for name, kls in [
-            ("label", DeviceMessages.GetLabel),
-            ("version", DeviceMessages.GetVersion),
-            ("firmware", DeviceMessages.GetHostFirmware),
-            ("group", DeviceMessages.GetGroup),
-            ("location", DeviceMessages.GetLocation),
-        ]:
-            setattr(Futs, name, Waiter(name, kls))
+        msgs = SWITCH_INFO_MSGS
+        assert tuple(e.value.msg for e in InfoPoints if e is not InfoPoints.LIGHT_STATE) == msgs
+
+        Futs = make_futs(
+            V.fake_device,
+            [
+                ("label", DeviceMessages.GetLabel),
+                ("version", DeviceMessages.GetVersion),
+                ("firmware", DeviceMessages.GetHostFirmware),
+                ("group", DeviceMessages.GetGroup),
+                ("location", DeviceMessages.GetLocation),
+            ],
+        )
 
         async def checker(ff):
             info = {"serial": V.fake_device.serial, "product_type": "unknown"}
@@ -468,52 +453,19 @@ describe "Device":
         await V.choose_device("light")
         fake_time.set(1)
 
-        msgs = [e.value.msg for e in list(InfoPoints) if e is not InfoPoints.LABEL]
-        assert msgs == [
-            LightMessages.GetColor(),
-            DeviceMessages.GetVersion(),
-            DeviceMessages.GetHostFirmware(),
-            DeviceMessages.GetGroup(),
-            DeviceMessages.GetLocation(),
-        ]
-
-        message_futs = {}
-
-        class Futs:
-            pass
-
-        class Waiter:
-            def __init__(s, name, kls):
-                s.name = name
-                s.kls = kls
-                s.make_fut()
-
-            def make_fut(s, res=None):
-                fut = message_futs[s.name] = V.fake_device.attrs.event_waiter.wait_for_incoming(
-                    V.fake_device.io["MEMORY"], s.kls
-                )
-                fut.add_done_callback(s.make_fut)
-
-            def __await__(s):
-                yield from message_futs[s.name]
-
-            def add_done_callback(s, cb):
-                message_futs[s.name].add_done_callback(cb)
-
-            def remove_done_callback(s, cb):
-                message_futs[s.name].remove_done_callback(cb)
-
-            def done(s):
-                return message_futs[s.name].done()
-
-        for name, kls in [
-            ("color", LightMessages.GetColor),
-            ("version", DeviceMessages.GetVersion),
-            ("firmware", DeviceMessages.GetHostFirmware),
-            ("group", DeviceMessages.GetGroup),
-            ("location", DeviceMessages.GetLocation),
-        ]:
-            setattr(Futs, name, Waiter(name, kls))
+        msgs = LIGHT_INFO_MSGS
+        assert tuple(e.value.msg for e in InfoPoints if e is not InfoPoints.LABEL) == msgs
+
+        Futs = make_futs(
+            V.fake_device,
+            [
+                ("color", LightMessages.GetColor),
+                ("version", DeviceMessages.GetVersion),
+                ("firmware", DeviceMessages.GetHostFirmware),
+                ("group", DeviceMessages.GetGroup),
+                ("location", DeviceMessages.GetLocation),
+            ],
+        )
 
         async def checker(ff, l):
             info = {"serial": V.fake_device.serial, "product_type": "unknown"}
@@ -623,7 +575,7 @@ describe "Device":
 
                 t1 = ts.add(V.device.refresh_information_loop(V.sender, None, V.finder.collections))
 
-                await asyncio.sleep(0)
+                await V.device.refreshing
                 assert V.device.refreshing.done()
                 private_refresh_information_loop.assert_called_once_with(
                     V.sender, None, V.finder.collections
@@ -633,7 +585,7 @@ describe "Device":
                 # Next time we add does nothing
                 t2 = ts.add(V.device.refresh_information_loop(V.sender, None, V.finder.collections))
 
-                await asyncio.sleep(0)
+                await t2
                 assert V.device.refreshing.done()
                 private_refresh_information_loop.assert_called_once_with(
                     V.sender, None, V.finder.collections
@@ -643,12 +595,12 @@ describe "Device":
 
                 # Now we stop the current one and restart again to actually be called
                 t1.cancel()
-                await asyncio.sleep(0)
+                await hp.wait_for_all_futures(t1)
                 assert not V.device.refreshing.done()
 
                 t3 = ts.add(V.device.refresh_information_loop(V.sender, None, V.finder.collections))
 
-                await asyncio.sleep(0)
+                await V.device.refreshing
                 assert V.device.refreshing.done()
                 assert len(private_refresh_information_loop.mock_calls) == 2
                 assert not t3.done()
@@ -397,6 +397,21 @@ describe "FromGenerator":
             for t in got:
                 assert t - start < 0.1
 
+    async it "sends a yielded message before one from a nested generator after it", sender:
+
+        async def inner(reference, sender, **kwargs):
+            yield DeviceMessages.GetLabel()
+
+        async def gen(reference, sender, **kwargs):
+            yield [DeviceMessages.GetPower(), FromGenerator(inner, reference_override=True)]
+
+        await sender(FromGenerator(gen, reference_override=True), light1.serial)
+
+        got = list(devices.store(light1).incoming(ignore=[DiscoveryMessages.GetService]))
+        assert len(got) == 2
+        assert got[0].pkt | DeviceMessages.GetPower
+        assert got[1].pkt | DeviceMessages.GetLabel
+
     async it "can wait for other messages", sender:
         got = {}
 
@@ -558,8 +573,10 @@ describe "FromGenerator":
                 ("secondary", 3),
                 ("primary", 4),
                 ("start", ("secondary", 4)),
-                ("secondary", 4),
+                # secondary 2 and the first tick of secondary 4 are due at the same time
+                # and the fake clock runs whichever the loop gets to first
                 ("secondary", 2),
+                ("secondary", 4),
                 ("secondary", 1),
                 ("secondary", 3),
                 ("secondary", 4),
@@ -5,6 +5,7 @@ from collections import defaultdict
 
 import pytest
 from photons_app import helpers as hp
+from photons_app.errors import FoundNoDevices
 from photons_app.special import FoundSerials
 from photons_control.script import Pipeline, Repeater
 from photons_messages import DeviceMessages, LightMessages
@@ -233,6 +234,75 @@ describe "Repeater":
         assert got == [0] * 6 + [30] * 6 + [60] * 6
         assert len(done) == 3
 
+    async it "can reuse discovery between loops", sender:
+        msgs = [
+            DeviceMessages.SetPower(level=0),
+            LightMessages.SetColor(hue=0, saturation=0, brightness=1, kelvin=4500),
+        ]
+
+        resets = []
+
+        class Reference(FoundSerials):
+            def reset(s):
+                resets.append(time.time())
+                super().reset()
+
+        done = []
+
+        async def on_done():
+            done.append(time.time())
+            if len(done) == 7:
+                raise Repeater.Stop
+
+        msg = Repeater(msgs, on_done_loop=on_done, discovery_interval=60)
+
+        def no_errors(err):
+            assert False, f"Got an error: {err}"
+
+        got = []
+        async for pkt in sender(msg, Reference(), error_catcher=no_errors):
+            got.append(time.time())
+
+        # Discovery takes 0.1 seconds and only happens for the first loop and the loop after a reset
+        # The interval is counted from the start of the loop that discovered
+        assert got == (
+            [0.1] * 6 + [30] * 6 + [60] * 6 + [90.1] * 6 + [120] * 6 + [150] * 6 + [180.1] * 6
+        )
+        assert done == [0.1, 30, 60, 90.1, 120, 150, 180.1]
+        assert resets == [60, 150]
+
+    async it "discovers again after a failed discovery", sender:
+        msgs = [DeviceMessages.SetPower(level=0)]
+
+        attempts = []
+
+        class Reference(FoundSerials):
+            async def find_serials(s, sender, *, timeout, broadcast=True):
+                attempts.append(time.time())
+                if len(attempts) == 1:
+                    raise FoundNoDevices()
+                return await super().find_serials(sender, timeout=timeout, broadcast=broadcast)
+
+        done = []
+
+        async def on_done():
+            done.append(time.time())
+            if len(done) == 4:
+                raise Repeater.Stop
+
+        msg = Repeater(msgs, on_done_loop=on_done, discovery_interval=60)
+
+        errors = []
+        got = []
+        async for pkt in sender(msg, Reference(), error_catcher=errors.append):
+            got.append(time.time())
+
+        # The failed discovery isn't kept, and the interval starts from the one that worked
+        assert errors == [FoundNoDevices()]
+        assert attempts == [0, 30]
+        assert got == [30.1] * 3 + [60] * 3 + [90] * 3
+        assert done == [0, 30.1, 60, 90]
+
     async it "runs on_done if we exit the full message early", sender:
         msgs = [
             DeviceMessages.SetPower(level=0),
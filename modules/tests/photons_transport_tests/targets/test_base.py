@@ -8,7 +8,7 @@ from delfick_project.norms import Meta, dictobj, sb
 from photons_app import helpers as hp
 from photons_app.formatter import MergedOptionStringFormatter
 from photons_control.script import FromGenerator
-from photons_messages import protocol_register
+from photons_messages import DeviceMessages, protocol_register
 from photons_transport.targets.base import Target
 from photons_transport.targets.item import Item
 from photons_transport.targets.script import ScriptRunner
@@ -265,3 +265,16 @@ describe "Target":
                 assert item_kls.mock_calls == [
                     mock.call([part11, part12, part13, part2simplified, part31, part32])
                 ]
+
+            async it "groups packets together", item_kls, target:
+                p1 = DeviceMessages.GetPower()
+                p2 = DeviceMessages.SetLabel(label="kitchen")
+                p3 = DeviceMessages.GetPower()
+
+                res = mock.Mock(name="res")
+                item_kls.return_value = res
+
+                assert list(target.simplify([p1, p2, p3])) == [res]
+                assert list(target.simplify(p1)) == [res]
+
+                assert item_kls.mock_calls == [mock.call([p1, p2, p3]), mock.call([p1])]